@@ -15,7 +15,7 @@ the directory structure and file contents of a Rust crate. The process is as fol
    "Cargo.lock", or any file whose name starts with "LICENSE" or "NOTICE", as well as binary files 
    (e.g., .webp, .jpg, .jpeg, .png).
 4. It generates a self-contained Python script that will recreate the crate’s structure and embedded file contents.
-   In the generated script each embedded file is annotated with a comment showing its relative path.
+   The contents are embedded as a base64-encoded zip blob that the generated script extracts.
 5. The generated file is named in the format: <crate_name>_recreate_YYMMDD_HHMM.py.
 6. The generated script is set as executable and its content is copied to the clipboard.
    (This copied content is the generated recreate script—not this crate recreator.)
@@ -27,64 +27,423 @@ Usage:
 import os
 import sys
 import argparse
+import base64
+import errno
+import io
+import shutil
+import sqlite3
 import subprocess
 import stat
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import re
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+# Set to True by the --verbose flag; gates per-directory/per-file tracing that
+# would otherwise dominate runtime on large trees.
+VERBOSE = False
+
+# All file-name ignore rules fused into one pattern matched in C: exact
+# names, LICENSE/NOTICE prefixes, binary/backup suffixes (case-insensitive)
+# and editor '~' backups. Compiled once at import.
+_SKIP_RE = re.compile(
+    r"(?:\.gitignore|Cargo\.lock|LICENSE.*|NOTICE.*"
+    r"|.*(?i:\.(?:webp|jpg|jpeg|png|bak))|.*~)$"
+)
+
+# Chunk size for the short-read fallback in _read_bytes; sized well above
+# st_blksize so even unexpectedly large files need only a handful of reads.
+_READ_CHUNK = 131072
+
+# On-disk content cache so repeated runs over an unchanged crate skip the
+# read phase entirely; entries are keyed by (path, mtime_ns, size).
+_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "mkcmt", "files.sqlite")
+
+# Matches `name = "..."` within the [package] section of a Cargo.toml;
+# compiled once at import instead of per line scanned.
+_CARGO_NAME_RE = re.compile(r'name\s*=\s*["\'](.+?)["\']')
+
+# Boilerplate of the generated recreate script. Kept as module-level templates
+# so generate_script only formats them once per run. The header is emitted
+# verbatim; the footer goes through .format (for the crate name), so braces
+# that must survive into the generated source are doubled there.
+_HEADER_TEMPLATE = '''#!/usr/bin/env python3
+import base64
+import io
+import os
+import sys
+import subprocess
+import zipfile
+
+def copy_to_clipboard(text):
+    """
+    Copies the given text to the system clipboard.
+    Uses 'clip' on Windows and 'pbcopy' on macOS.
+    """
+    try:
+        if sys.platform.startswith('win'):
+            proc = subprocess.Popen(['clip'], stdin=subprocess.PIPE, close_fds=True)
+            proc.communicate(input=text.encode('utf-8'))
+        elif sys.platform == 'darwin':
+            proc = subprocess.Popen(['pbcopy'], stdin=subprocess.PIPE, close_fds=True)
+            proc.communicate(input=text.encode('utf-8'))
+        else:
+            print('[TRACE] Clipboard copy not supported on this platform.')
+    except Exception as e:
+        print(f'[ERROR] Failed to copy to clipboard: {e}')
+
+def copy_self_to_clipboard():
+    """
+    Reads its own source file and copies the content to the clipboard.
+    Provides detailed tracing for debugging.
+    """
+    try:
+        with open(__file__, 'r', encoding='utf-8') as f:
+            content = f.read()
+        copy_to_clipboard(content)
+        print('[TRACE] The script has been copied to the clipboard.')
+    except Exception as e:
+        print(f'[ERROR] Failed to copy self to clipboard: {e}')
+
+# base64-encoded, deflate-compressed zip archive of the crate contents.
+_BLOB = (
+'''
+
+_FOOTER_TEMPLATE = ''')
+
+# Paths whose contents duplicate another archive member; each maps to the
+# canonical member that actually holds the bytes.
+_DUPES = {dupes}
+
+def _write_member(base_folder, seen_dirs, name, data):
+    """
+    Write one file, creating its directory only the first time it is seen.
+    A single raw os.write per file; buffered text IO would split small
+    writes across st_blksize-sized chunks.
+    """
+    full_path = os.path.join(base_folder, *name.split('/'))
+    directory = os.path.dirname(full_path)
+    if directory not in seen_dirs:
+        os.makedirs(directory, exist_ok=True)
+        seen_dirs.add(directory)
+    fd = os.open(full_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+def create_crate():
+    """
+    Recreates the directory structure and files for the crate.
+    Provides detailed tracing for each step.
+    """
+    base_folder = os.path.join(os.getcwd(), '{crate_name}')
+    print(f'[TRACE] Creating base folder: {{base_folder}}')
+    os.makedirs(base_folder, exist_ok=True)
+    seen_dirs = set()
+    with zipfile.ZipFile(io.BytesIO(base64.b64decode(_BLOB))) as zf:
+        names = zf.namelist()
+        for name in names:
+            _write_member(base_folder, seen_dirs, name, zf.read(name))
+        for name, canonical in _DUPES.items():
+            _write_member(base_folder, seen_dirs, name, zf.read(canonical))
+    print(f'[TRACE] Extracted {{len(names) + len(_DUPES)}} files into {{base_folder}}.')
+
+if __name__ == '__main__':
+    create_crate()
+    # Uncomment the next line to enable self-copy functionality.
+    # copy_self_to_clipboard()
+    print('[TRACE] Crate creation complete.')
+'''
+
+# True when the platform can traverse via directory fds (openat semantics),
+# sparing the kernel a full path resolution per directory, as os.fwalk does.
+_HAS_DIR_FD = (
+    hasattr(os, "O_DIRECTORY")
+    and os.open in os.supports_dir_fd
+    and os.scandir in os.supports_fd
+)
+
+def _iter_files_fd(root, ignore_dirs, skip_re):
+    """
+    dir_fd-based variant of _iter_files for POSIX. Each subdirectory is
+    opened relative to its parent's fd and scanned through that fd, so deep
+    paths are resolved one component at a time instead of from the root for
+    every directory. Recursing per directory, as os.fwalk does, bounds the
+    open fds to one per tree depth rather than one per pending sibling.
+    Yields the same (full_path, rel_path, size, mtime_ns) tuples; full paths
+    are rebuilt by concatenation for the read phase.
+
+    EMFILE/ENFILE is re-raised rather than skipped: running out of fds must
+    fall back to the path-based walk, not silently truncate the archive.
+    """
+    sep = os.sep
+    base = root.rstrip(sep) or sep
+
+    def walk(fd, prefix):
+        subdirs = []
+        try:
+            it = os.scandir(fd)
+        except OSError as e:
+            if e.errno in (errno.EMFILE, errno.ENFILE):
+                raise
+            print(f"[WARNING] Skipping directory {base}{sep}{prefix} due to scan error: {e}")
+            return
+        with it:
+            for entry in it:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name.lower() in ignore_dirs:
+                        if VERBOSE:
+                            print(f"[TRACE] Excluding directory: {name}")
+                        continue
+                    subdirs.append(name)
+                    continue
+                # Check ignore conditions for file names.
+                if skip_re.match(name):
+                    if VERBOSE:
+                        print(f"[TRACE] Ignoring file: {name}")
+                    continue
+                rel_path = prefix + name
+                try:
+                    st = entry.stat()
+                except OSError as e:
+                    # Dangling symlink, or the file vanished since scandir.
+                    print(f"[WARNING] Skipping file {base}{sep}{rel_path} due to read error: {e}")
+                    continue
+                yield f"{base}{sep}{rel_path}", rel_path, st.st_size, st.st_mtime_ns
+        for name in subdirs:
+            try:
+                child_fd = os.open(name, os.O_RDONLY | os.O_DIRECTORY, dir_fd=fd)
+            except OSError as e:
+                if e.errno in (errno.EMFILE, errno.ENFILE):
+                    raise
+                print(f"[WARNING] Skipping directory {base}{sep}{prefix}{name} due to open error: {e}")
+                continue
+            try:
+                yield from walk(child_fd, f"{prefix}{name}{sep}")
+            finally:
+                os.close(child_fd)
+
+    root_fd = os.open(base, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        yield from walk(root_fd, "")
+    finally:
+        os.close(root_fd)
+
+def _iter_files(root, ignore_dirs, skip_re):
+    """
+    Iteratively walk `root` with os.scandir and yield
+    (full_path, rel_path, size, mtime_ns) tuples for every file that passes
+    the ignore rules.
+
+    An explicit stack replaces os.walk so DirEntry.is_dir()/is_file() results
+    (cached from readdir on Linux) are reused instead of re-stat'ing, and
+    ignored directories are skipped before ever being opened. On POSIX the
+    walk descends through directory fds instead of full paths.
+    """
+    seen = ()
+    if _HAS_DIR_FD:
+        seen = set()
+        try:
+            for item in _iter_files_fd(root, ignore_dirs, skip_re):
+                seen.add(item[1])
+                yield item
+            return
+        except OSError as e:
+            if e.errno not in (errno.EMFILE, errno.ENFILE):
+                raise
+            # Out of fds: restart with the path-based walk (which holds one
+            # fd at a time), skipping what the fd walk already yielded,
+            # rather than shipping a truncated file set.
+            print("[WARNING] Out of file descriptors during fd-based walk; "
+                  "falling back to the path-based walk.")
+    # Every entry.path extends root, so the relative path is a plain slice;
+    # os.path.relpath would re-abspath and split both sides for every file.
+    prefix_len = len(root.rstrip(os.sep)) + 1
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError as e:
+            print(f"[WARNING] Skipping directory {current} due to scan error: {e}")
+            continue
+        with it:
+            for entry in it:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name.lower() in ignore_dirs:
+                        if VERBOSE:
+                            print(f"[TRACE] Excluding directory: {name}")
+                        continue
+                    stack.append(entry.path)
+                    continue
+                # Check ignore conditions for file names.
+                if skip_re.match(name):
+                    if VERBOSE:
+                        print(f"[TRACE] Ignoring file: {name}")
+                    continue
+                rel_path = entry.path[prefix_len:]
+                if rel_path in seen:
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError as e:
+                    # Dangling symlink, or the file vanished since scandir.
+                    print(f"[WARNING] Skipping file {entry.path} due to read error: {e}")
+                    continue
+                yield entry.path, rel_path, st.st_size, st.st_mtime_ns
+
+def _read_bytes(full_path, size):
+    """
+    Slurp a file via raw os.open/os.read, skipping the buffered IO stack
+    (fstat + lseek + isatty syscalls and BufferedReader allocation) that
+    open() performs for every file.
+
+    `size` is the st_size cached by the scandir traversal; if the first read
+    comes back short (or the size was zero), fall back to incremental reads.
+    """
+    fd = os.open(full_path, os.O_RDONLY)
+    try:
+        data = os.read(fd, size) if size > 0 else b""
+        if len(data) < size or size == 0:
+            chunks = [data]
+            while True:
+                chunk = os.read(fd, _READ_CHUNK)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data = b"".join(chunks)
+        return data
+    finally:
+        os.close(fd)
+
+def _open_cache():
+    """
+    Open (creating if needed) the sqlite content cache at _CACHE_PATH.
+    Returns the connection, or None when the cache cannot be used; a broken
+    cache must never fail the run.
+    """
+    try:
+        os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+        conn = sqlite3.connect(_CACHE_PATH)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS files "
+            "(path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, content BLOB)"
+        )
+        return conn
+    except Exception as e:
+        print(f"[WARNING] File cache unavailable ({e}); reading everything.")
+        return None
+
+def _load_one(task):
+    """
+    Worker for the read pool: read one traversal task and return
+    (rel_path, content bytes), or (rel_path, None) for files that
+    cannot be read or are not valid UTF-8.
+    """
+    full_path, rel_path, size, _mtime_ns = task
+    if VERBOSE:
+        print(f"[TRACE] Processing file: {full_path} as {rel_path}")
+    try:
+        content = _read_bytes(full_path, size)
+        # Decode purely to reject non-UTF-8 (binary) files, as the old
+        # text-mode read did; the bytes themselves are what we keep.
+        content.decode("utf-8")
+    except Exception as e:
+        print(f"[WARNING] Skipping file {full_path} due to read error: {e}")
+        return rel_path, None
+    return rel_path, content
+
 def gather_files(source_folder):
     """
     Walk the source folder recursively and return a dictionary mapping
-    relative file paths to their contents.
+    relative file paths to their contents as UTF-8-validated bytes. Keeping
+    the raw bytes avoids re-encoding every file when the zip blob is built.
 
     Excludes directories named "target" (case-insensitive), ".git", ".aipack", ".github",
-    and files such as ".gitignore", "Cargo.lock", or any file whose name starts with 
+    and files such as ".gitignore", "Cargo.lock", or any file whose name starts with
     "LICENSE" or "NOTICE". Also ignores binary files with extensions like .webp, .jpg, .jpeg, .png.
 
     Provides detailed tracing for debugging.
     """
-    ignore_dirs = {".git", ".aipack", ".github"}
-    ignore_files = {".gitignore", "Cargo.lock"}
-    binary_extensions = (".webp", ".jpg", ".jpeg", ".png")
+    # Lowercased once here so the per-directory comparison is a single set lookup.
+    ignore_dirs = {"target", ".git", ".aipack", ".github"}
     files_dict = {}
     print(f"[TRACE] Starting to traverse source folder: {source_folder}")
-    for root, dirs, files in os.walk(source_folder):
-        # Exclude specified directories.
-        original_dirs = dirs.copy()
-        dirs[:] = [d for d in dirs if d.lower() != "target" and d not in ignore_dirs]
-        for excluded in set(original_dirs) - set(dirs):
-            print(f"[TRACE] Excluding directory: {excluded}")
-        # Process each file in the current directory.
-        for file in files:
-            # Check ignore conditions for file names.
-            if file in ignore_files  or file.endswith(('.bak', '~')):
-                print(f"[TRACE] Ignoring file: {file}")
-                continue
-            if file.startswith("LICENSE") or file.startswith("NOTICE"):
-                print(f"[TRACE] Ignoring file (starts with LICENSE or NOTICE): {file}")
-                continue
-            lower_file = file.lower()
-            if lower_file.endswith(binary_extensions):
-                print(f"[TRACE] Ignoring binary file: {file}")
-                continue
+    entries = list(_iter_files(source_folder, ignore_dirs, _SKIP_RE))
+
+    # Serve unchanged files from the on-disk cache; only stat mismatches
+    # (or everything, if the cache is unavailable) hit the read pool.
+    cache = _open_cache()
+    cached = {}
+    misses = []
+    if cache is not None:
+        for task in entries:
+            full_path, rel_path, size, mtime_ns = task
+            row = cache.execute(
+                "SELECT content FROM files WHERE path = ? AND mtime_ns = ? AND size = ?",
+                (full_path, mtime_ns, size),
+            ).fetchone()
+            if row is not None:
+                cached[rel_path] = row[0]
+            else:
+                misses.append(task)
+    else:
+        misses = entries
+
+    results = {}
+    if misses:
+        # Reads are I/O bound and release the GIL, so fan them out across a
+        # thread pool; executor.map preserves traversal order.
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for rel_path, content in executor.map(_load_one, misses):
+                if content is not None:
+                    results[rel_path] = content
+
+    # Assemble in traversal order regardless of which side served the bytes.
+    for full_path, rel_path, size, mtime_ns in entries:
+        if rel_path in cached:
+            files_dict[rel_path] = cached[rel_path]
+        elif rel_path in results:
+            files_dict[rel_path] = results[rel_path]
+
+    if cache is not None:
+        try:
+            rows = [
+                (full_path, mtime_ns, size, results[rel_path])
+                for full_path, rel_path, size, mtime_ns in misses
+                if rel_path in results
+            ]
+            if rows:
+                with cache:
+                    cache.executemany(
+                        "INSERT OR REPLACE INTO files (path, mtime_ns, size, content) "
+                        "VALUES (?, ?, ?, ?)",
+                        rows,
+                    )
+            cache.close()
+            print(f"[TRACE] File cache: {len(cached)} hits, {len(misses)} misses.")
+        except Exception as e:
+            print(f"[WARNING] Failed to update file cache: {e}")
 
-            full_path = os.path.join(root, file)
-            # Compute relative path based on the source folder.
-            rel_path = os.path.relpath(full_path, source_folder)
-            print(f"[TRACE] Processing file: {full_path} as {rel_path}")
-            try:
-                with open(full_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-            except Exception as e:
-                print(f"[WARNING] Skipping file {full_path} due to read error: {e}")
-                continue
-            files_dict[rel_path] = content
     print(f"[TRACE] Completed traversing. Total files gathered: {len(files_dict)}")
     return files_dict
 
-def generate_script(files_dict, crate_name):
+def generate_script(files_dict, crate_name, out_fp):
     """
-    Generate a self-contained Python script as a string.
+    Write a self-contained Python script to the open text file `out_fp`.
     When run, the generated script creates a folder (named after the crate)
     and reconstructs all files with their original contents.
 
@@ -92,96 +451,74 @@ def generate_script(files_dict, crate_name):
       - A function to copy its own source code to the clipboard.
       - Detailed tracing messages to follow its execution.
 
-    Each embedded file is annotated with a trailing comment indicating its relative path.
-    
-    Returns:
-        A string containing the full source code of the generated script.
+    File contents are embedded as a single base64-encoded, deflate-compressed
+    zip blob rather than per-file string literals, which keeps the generated
+    script small and lets it materialize the tree with one extractall.
+
+    Streaming to the file handle avoids ever holding the full script text in
+    memory on top of the blob itself.
     """
-    lines = []
-    lines.append("#!/usr/bin/env python3")
-    lines.append("import os")
-    lines.append("import sys")
-    lines.append("import subprocess")
-    lines.append("")
-    lines.append("def copy_to_clipboard(text):")
-    lines.append("    \"\"\"")
-    lines.append("    Copies the given text to the system clipboard.")
-    lines.append("    Uses 'clip' on Windows and 'pbcopy' on macOS.")
-    lines.append("    \"\"\"")
-    lines.append("    try:")
-    lines.append("        if sys.platform.startswith('win'):")
-    lines.append("            proc = subprocess.Popen(['clip'], stdin=subprocess.PIPE, close_fds=True)")
-    lines.append("            proc.communicate(input=text.encode('utf-8'))")
-    lines.append("        elif sys.platform == 'darwin':")
-    lines.append("            proc = subprocess.Popen(['pbcopy'], stdin=subprocess.PIPE, close_fds=True)")
-    lines.append("            proc.communicate(input=text.encode('utf-8'))")
-    lines.append("        else:")
-    lines.append("            print('[TRACE] Clipboard copy not supported on this platform.')")
-    lines.append("    except Exception as e:")
-    lines.append("        print(f'[ERROR] Failed to copy to clipboard: {e}')")
-    lines.append("")
-    lines.append("def copy_self_to_clipboard():")
-    lines.append("    \"\"\"")
-    lines.append("    Reads its own source file and copies the content to the clipboard.")
-    lines.append("    Provides detailed tracing for debugging.")
-    lines.append("    \"\"\"")
-    lines.append("    try:")
-    lines.append("        with open(__file__, 'r', encoding='utf-8') as f:")
-    lines.append("            content = f.read()")
-    lines.append("        copy_to_clipboard(content)")
-    lines.append("        print('[TRACE] The script has been copied to the clipboard.')")
-    lines.append("    except Exception as e:")
-    lines.append("        print(f'[ERROR] Failed to copy self to clipboard: {e}')")
-    lines.append("")
-    lines.append("def create_crate():")
-    lines.append("    \"\"\"")
-    lines.append("    Recreates the directory structure and files for the crate.")
-    lines.append("    Provides detailed tracing for each step.")
-    lines.append("    \"\"\"")
-    lines.append(f"    base_folder = os.path.join(os.getcwd(), '{crate_name}')")
-    lines.append("    print(f'[TRACE] Creating base folder: {base_folder}')")
-    lines.append("    os.makedirs(base_folder, exist_ok=True)")
-    lines.append("    files = {")
-    # Embed each file's content along with a comment indicating its relative path.
-    for path, content in files_dict.items():
-        lines.append(f"        {repr(path)}: {repr(content)},  # File: {path}")
-    lines.append("    }")
-    lines.append("")
-    lines.append("    for relative_path, content in files.items():")
-    lines.append("        full_path = os.path.join(base_folder, relative_path)")
-    lines.append("        directory = os.path.dirname(full_path)")
-    lines.append("        if not os.path.exists(directory):")
-    lines.append("            os.makedirs(directory, exist_ok=True)")
-    lines.append("            print(f'[TRACE] Created directory: {directory}')")
-    lines.append("        with open(full_path, 'w', encoding='utf-8') as f:")
-    lines.append("            f.write(content)")
-    lines.append("        print(f'[TRACE] Created file: {full_path}')")
-    lines.append("")
-    lines.append("if __name__ == '__main__':")
-    lines.append("    create_crate()")
-    lines.append("    # Uncomment the next line to enable self-copy functionality.")
-    lines.append("    # copy_self_to_clipboard()")
-    lines.append("    print('[TRACE] Crate creation complete.')")
-    
-    return "\n".join(lines)
+    buf = io.BytesIO()
+    # Store each unique content once; crates routinely repeat small files
+    # (empty mod.rs stubs, license headers), and the duplicates collapse to
+    # one path -> canonical-member entry in the generated script.
+    first_member = {}
+    dupes = {}
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for path, content in files_dict.items():
+            # Zip member names always use forward slashes.
+            member = path.replace(os.sep, "/")
+            canonical = first_member.setdefault(content, member)
+            if canonical is member:
+                zf.writestr(member, content)
+            else:
+                dupes[member] = canonical
+    b64 = base64.b64encode(buf.getvalue()).decode("ascii")
+    out_fp.write(_HEADER_TEMPLATE)
+    # Wrap the blob at 76 columns as adjacent string literals so the
+    # generated file stays manageable in editors and diffs.
+    out_fp.writelines(f"    '{b64[i:i + 76]}'\n" for i in range(0, len(b64), 76))
+    out_fp.write(_FOOTER_TEMPLATE.format(crate_name=crate_name, dupes=repr(dupes)))
 
-def copy_to_clipboard(text):
+def _detect_clipboard_cmd():
     """
-    Copies the given text to the system clipboard.
-    Uses 'clip' on Windows and 'pbcopy' on macOS.
-    Provides tracing information.
+    Probe for a clipboard command once at import: 'clip' on Windows,
+    'pbcopy' on macOS, and 'wl-copy' (Wayland) or 'xclip' (X11) on other
+    platforms. Returns the argv to spawn, or None if nothing is available.
     """
+    if sys.platform.startswith("win"):
+        return ["clip"]
+    if sys.platform == "darwin":
+        return ["pbcopy"]
+    if shutil.which("wl-copy"):
+        return ["wl-copy"]
+    if shutil.which("xclip"):
+        return ["xclip", "-selection", "clipboard"]
+    return None
+
+_CLIPBOARD_CMD = _detect_clipboard_cmd()
+
+def copy_to_clipboard(text=None, path=None):
+    """
+    Copies the given text, or the contents of the file at `path`, to the
+    system clipboard. A path is streamed into the clipboard process in
+    1 MiB chunks, so large payloads are never encoded in memory twice.
+    Uses the command probed at import ('clip', 'pbcopy', 'wl-copy' or
+    'xclip'). Provides tracing information.
+    """
+    if _CLIPBOARD_CMD is None:
+        print("[TRACE] No clipboard command available on this platform.")
+        return
     try:
-        if sys.platform.startswith("win"):
-            print("[TRACE] Using 'clip' for clipboard copy on Windows.")
-            proc = subprocess.Popen(["clip"], stdin=subprocess.PIPE, close_fds=True)
-            proc.communicate(input=text.encode("utf-8"))
-        elif sys.platform == "darwin":
-            print("[TRACE] Using 'pbcopy' for clipboard copy on macOS.")
-            proc = subprocess.Popen(["pbcopy"], stdin=subprocess.PIPE, close_fds=True)
-            proc.communicate(input=text.encode("utf-8"))
+        print(f"[TRACE] Using '{_CLIPBOARD_CMD[0]}' for clipboard copy.")
+        proc = subprocess.Popen(_CLIPBOARD_CMD, stdin=subprocess.PIPE, close_fds=True)
+        if path is not None:
+            with open(path, "rb") as f:
+                shutil.copyfileobj(f, proc.stdin, length=1 << 20)
+            proc.stdin.close()
+            proc.wait()
         else:
-            print("[TRACE] Clipboard copy not supported on this platform.")
+            proc.communicate(input=text.encode("utf-8"))
     except Exception as e:
         print(f"[ERROR] Failed to copy to clipboard: {e}")
 
@@ -206,10 +543,19 @@ def find_cargo_toml(start_dir):
 def get_crate_name_from_cargo_toml(cargo_toml_path):
     """
     Parse the Cargo.toml file to extract the crate name from the [package] section.
-    Returns the crate name if found, otherwise None.
+    Uses the stdlib tomllib parser (tomli on older Pythons) and falls back to a
+    line scan when neither is available. Returns the crate name if found,
+    otherwise None.
     """
-    in_package = False
     try:
+        if tomllib is not None:
+            with open(cargo_toml_path, "rb") as f:
+                data = tomllib.load(f)
+            crate_name = data.get("package", {}).get("name")
+            if crate_name:
+                print(f"[TRACE] Crate name found in Cargo.toml: {crate_name}")
+            return crate_name
+        in_package = False
         with open(cargo_toml_path, "r", encoding="utf-8") as f:
             for line in f:
                 stripped = line.strip()
@@ -219,7 +565,7 @@ def get_crate_name_from_cargo_toml(cargo_toml_path):
                     # Exiting the [package] section.
                     break
                 elif in_package and stripped.startswith("name"):
-                    match = re.search(r'name\s*=\s*["\'](.+?)["\']', stripped)
+                    match = _CARGO_NAME_RE.search(stripped)
                     if match:
                         crate_name = match.group(1)
                         print(f"[TRACE] Crate name found in Cargo.toml: {crate_name}")
@@ -234,8 +580,12 @@ def main():
     )
     parser.add_argument("source_folder", help="Path to the source folder (should be within or at the crate root).")
     parser.add_argument("--src-only", action="store_true", help="Process only the 'src' folder inside the crate root.")
+    parser.add_argument("--verbose", action="store_true", help="Enable per-file/per-directory trace output.")
     args = parser.parse_args()
 
+    global VERBOSE
+    VERBOSE = args.verbose
+
     # Resolve the absolute path of the provided source folder.
     orig_source_folder = os.path.abspath(args.source_folder)
     print(f"[TRACE] Source folder resolved to: {orig_source_folder}")
@@ -271,15 +621,14 @@ def main():
     # Gather files from the determined source folder.
     files_dict = gather_files(source_folder)
 
-    # Generate the script content (this is the recreate script that will be copied to clipboard).
-    generated_script = generate_script(files_dict, crate_name)
-
     # Create a timestamped output file name in the format: <crate_name>_recreate_YYMMDD_HHMM.py
     timestamp = datetime.now().strftime("%y%m%d_%H%M")
     output_file = f"{crate_name}_recreate_{timestamp}.py"
     print(f"[TRACE] Writing generated script to: {output_file}")
+    # Stream the recreate script straight to disk; the full text is never
+    # assembled in memory.
     with open(output_file, "w", encoding="utf-8") as f:
-        f.write(generated_script)
+        generate_script(files_dict, crate_name, f)
     
     # Set the generated script to be executable.
     try:
@@ -291,10 +640,14 @@ def main():
 
     print(f"[TRACE] Generated script saved to {output_file}.")
 
-    # Copy the generated recreate script's content to the clipboard.
+    # Copy the generated recreate script's content to the clipboard,
+    # streamed from the file just written rather than from memory.
     # (This is the script that, when run, will recreate the crate.)
-    copy_to_clipboard(generated_script)
-    print("[TRACE] Generated script copied to clipboard.")
+    if _CLIPBOARD_CMD is None:
+        print("[TRACE] No clipboard command found; skipping clipboard copy.")
+    else:
+        copy_to_clipboard(path=output_file)
+        print("[TRACE] Generated script copied to clipboard.")
 
 if __name__ == "__main__":
     main()